@@ -37,6 +37,10 @@ def create_app():
     from routes import routes_blueprint
     app.register_blueprint(routes_blueprint)
 
+    # Serve fingerprinted, precompressed static assets and expose asset_url() to templates.
+    from assets import register_assets
+    register_assets(app)
+
     # Create tables if they don't exist.
     with app.app_context():
         db.create_all()
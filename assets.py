@@ -0,0 +1,127 @@
+# assets.py
+# Build step and serving logic for RadChat's static assets.
+#
+# Running `python assets.py` minifies everything under static/js and static/css,
+# writes content-hashed copies (plus .gz and .br precompressed variants) to
+# static/dist, and records the original -> fingerprinted names in a manifest.
+# At runtime the templates call asset_url() to get the fingerprinted URL, and
+# /assets/<filename> serves the best precompressed variant with immutable caching.
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import shutil
+
+import brotli
+import rcssmin
+import rjsmin
+from flask import Blueprint, request, send_from_directory, url_for
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(BASE_DIR, 'static')
+DIST_DIR = os.path.join(STATIC_DIR, 'dist')
+MANIFEST_PATH = os.path.join(DIST_DIR, 'asset-manifest.json')
+
+# Fingerprinted files never change, so browsers may cache them for a year
+ASSET_MAX_AGE = 60 * 60 * 24 * 365
+
+# Minifier to use for each asset type, keyed by file extension
+MINIFIERS = {
+    '.js': rjsmin.jsmin,
+    '.css': rcssmin.cssmin,
+}
+
+# Precompressed variants in order of preference: (Content-Encoding, file suffix)
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+# Blueprint serving the built assets (kept separate from Flask's /static handler)
+assets_blueprint = Blueprint('assets', __name__)
+
+
+# Minify, fingerprint and precompress every asset, then write the manifest
+def build_assets():
+    # Start from a clean output directory so stale fingerprints don't pile up
+    shutil.rmtree(DIST_DIR, ignore_errors=True)
+    manifest = {}
+
+    for subdir in ('js', 'css'):
+        source_dir = os.path.join(STATIC_DIR, subdir)
+        for filename in sorted(os.listdir(source_dir)):
+            name, ext = os.path.splitext(filename)
+            if ext not in MINIFIERS:
+                continue
+
+            with open(os.path.join(source_dir, filename), encoding='utf-8') as f:
+                content = MINIFIERS[ext](f.read()).encode('utf-8')
+
+            # Name the output after a hash of its contents so any change busts caches
+            digest = hashlib.sha256(content).hexdigest()[:12]
+            built_name = f"{subdir}/{name}.{digest}{ext}"
+            built_path = os.path.join(DIST_DIR, built_name)
+            os.makedirs(os.path.dirname(built_path), exist_ok=True)
+
+            with open(built_path, 'wb') as f:
+                f.write(content)
+            # mtime=0 keeps the gzip output byte-for-byte reproducible between builds
+            with open(built_path + '.gz', 'wb') as f:
+                f.write(gzip.compress(content, compresslevel=9, mtime=0))
+            with open(built_path + '.br', 'wb') as f:
+                f.write(brotli.compress(content, quality=11))
+
+            manifest[f"{subdir}/{filename}"] = built_name
+            print(f"Built {subdir}/{filename} -> {built_name}")
+
+    with open(MANIFEST_PATH, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    return manifest
+
+
+# Load the manifest written by build_assets(), or an empty one if assets were never built
+def load_manifest():
+    try:
+        with open(MANIFEST_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print("Asset manifest not found. Run `python assets.py` to build fingerprinted assets.")
+        return {}
+
+
+# Route to serve a fingerprinted asset, preferring a precompressed variant the client accepts
+@assets_blueprint.route('/assets/<path:filename>', methods=['GET'])
+def serve_asset(filename):
+    mimetype = mimetypes.guess_type(filename)[0]
+
+    for encoding, suffix in ENCODINGS:
+        if request.accept_encodings[encoding] and os.path.isfile(os.path.join(DIST_DIR, filename + suffix)):
+            response = send_from_directory(DIST_DIR, filename + suffix, mimetype=mimetype, max_age=ASSET_MAX_AGE)
+            response.headers['Content-Encoding'] = encoding
+            break
+    else:
+        response = send_from_directory(DIST_DIR, filename, mimetype=mimetype, max_age=ASSET_MAX_AGE)
+
+    # Caches must key on the encoding since the body differs per Accept-Encoding
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+
+# Register the asset route and the asset_url() template helper on the app
+def register_assets(app):
+    app.register_blueprint(assets_blueprint)
+    manifest = load_manifest()
+
+    # Resolve a static path (e.g. 'js/chatwindow.js') to its fingerprinted URL,
+    # falling back to the plain /static URL when the asset hasn't been built
+    @app.template_global()
+    def asset_url(path):
+        built_name = manifest.get(path)
+        if built_name is None:
+            return url_for('static', filename=path)
+        return url_for('assets.serve_asset', filename=built_name)
+
+
+if __name__ == '__main__':
+    build_assets()